@@ -1,7 +1,9 @@
+import errno
+import functools
 import math
 import os
-import queue
 import re
+import select
 import shutil
 import signal
 import socket
@@ -9,8 +11,9 @@ import subprocess
 import threading
 import time
 import tkinter as tk
-import urllib.request
 import webbrowser
+from collections import deque
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -20,13 +23,38 @@ import customtkinter as ctk
 # ---------------- CONFIG ----------------
 DEFAULT_HOST = "127.0.0.1"
 DEFAULT_PORT = 8000
+LOG_QUEUE_MAX = 10000  # pending log lines kept; the oldest are dropped first
+LOG_POOL_MAX = 1024  # recycled LogEvent instances kept for reuse
+PIPE_READ_SIZE = 65536  # bytes per os.read() on subprocess output
+LOG_VIEW_MAX_LINES = 5000  # log widget is trimmed back to LOG_VIEW_KEEP_LINES
+LOG_VIEW_KEEP_LINES = 4000
+PAGE_TRANSITION_S = 0.26  # page slide duration, seconds
 PROJECT_ROOT = Path(__file__).resolve().parent
 DEV_ARGS_BASE = ["run", "dev", "--"]  # npm run dev -- ...
+# Vite's "➜  Local:   http://host:port/" banner; group 1 is the bound port
+VITE_READY_RE = re.compile(rb"Local:\s+http://\S+:(\d+)/")
+ANSI_RE = re.compile(rb"\x1b\[[0-9;]*[A-Za-z]")  # terminal color/style codes
 
 
 # ---------------- UTIL ----------------
+_npm_path_cache: tuple[str | None, str] | None = None  # (override env, path)
+
+
 def resolve_npm_path() -> str | None:
+    # The lookup is stable for the process lifetime, so remember a hit and
+    # only redo it if LOCAL_VITE_NPM_PATH changes. Misses aren't cached so a
+    # freshly installed Node.js is picked up on the next start.
+    global _npm_path_cache
     override = os.environ.get("LOCAL_VITE_NPM_PATH")
+    if _npm_path_cache is not None and _npm_path_cache[0] == override:
+        return _npm_path_cache[1]
+    found = _find_npm(override)
+    if found:
+        _npm_path_cache = (override, found)
+    return found
+
+
+def _find_npm(override: str | None) -> str | None:
     if override:
         candidate = Path(override).expanduser()
         if candidate.exists():
@@ -67,25 +95,168 @@ def npm_cmd(npm_path: str, args: list[str]) -> list[str]:
     return [npm_path, *args]
 
 
+def pop_lines(buf: bytearray) -> list[bytes]:
+    # Remove every complete line from buf; a trailing partial line stays put.
+    lines = []
+    start = 0
+    while (i := buf.find(b"\n", start)) >= 0:
+        lines.append(bytes(buf[start:i]))
+        start = i + 1
+    del buf[:start]
+    return lines
+
+
+def iter_pipe_batches(fd: int):
+    # Read raw bytes in large chunks and split locally; one syscall can carry
+    # a whole burst of dev-server output, which is yielded as one batch.
+    buf = bytearray()
+    while True:
+        try:
+            chunk = os.read(fd, PIPE_READ_SIZE)
+        except OSError:
+            break
+        if not chunk:
+            break
+        buf += chunk
+        lines = pop_lines(buf)
+        if lines:
+            yield lines
+    if buf:
+        yield [bytes(buf)]
+
+
+def wait_for_exit(p: subprocess.Popen) -> int:
+    # Block until the child exits without polling: a pidfd on Linux, a
+    # kqueue NOTE_EXIT on macOS/BSD, plain wait() everywhere else.
+    try:
+        if hasattr(os, "pidfd_open"):
+            fd = os.pidfd_open(p.pid)
+            try:
+                poller = select.poll()
+                poller.register(fd, select.POLLIN)
+                poller.poll()
+            finally:
+                os.close(fd)
+        elif hasattr(select, "kqueue"):
+            kq = select.kqueue()
+            try:
+                ev = select.kevent(
+                    p.pid,
+                    filter=select.KQ_FILTER_PROC,
+                    flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT,
+                    fflags=select.KQ_NOTE_EXIT,
+                )
+                kq.control([ev], 1, None)
+            finally:
+                kq.close()
+    except OSError:
+        pass  # already reaped or unsupported kernel; wait() below covers it
+    return p.wait()
+
+
+def stop_tree_nt(p: subprocess.Popen) -> None:
+    # Windows: Ctrl+Break the server's process group, then taskkill whatever is
+    # left. A cmd.exe shim (npm.cmd) stops at "Terminate batch job (Y/N)?" on
+    # Ctrl+Break, so it goes straight to taskkill.
+    if p.args[0] != "cmd.exe":
+        try:
+            os.kill(p.pid, signal.CTRL_BREAK_EVENT)
+            p.wait(timeout=2)
+            return
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+    try:
+        subprocess.run(
+            ["taskkill", "/PID", str(p.pid), "/T", "/F"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        )
+    except OSError:
+        pass
+
+
+def http_head_status(host: str, port: int, timeout: float = 0.3) -> int | None:
+    # Bare "HEAD / HTTP/1.0" probe: reads just enough to parse the status line.
+    try:
+        req = b"HEAD / HTTP/1.0\r\nHost: %s:%d\r\nConnection: close\r\n\r\n" % (
+            host.encode("idna"),
+            port,
+        )
+        with socket.create_connection((host, port), timeout=timeout) as s:
+            s.sendall(req)
+            head = s.recv(64)
+    except (OSError, UnicodeError):
+        return None
+    parts = head.split(None, 2)  # b"HTTP/1.1", b"200", b"OK\r\n…"
+    if len(parts) >= 2 and parts[0].startswith(b"HTTP/") and parts[1].isdigit():
+        return int(parts[1])
+    return None
+
+
 def now_ts() -> str:
     return datetime.now().strftime("%H:%M:%S")
 
 
+@functools.lru_cache(maxsize=64)
+def _hex_rgb(color: str) -> int:
+    return int(color.lstrip("#"), 16)
+
+
+@functools.lru_cache(maxsize=1024)
+def _blend_rgb(a: int, b: int, t8: int) -> str:
+    # Packed 0xRRGGBB lerp: red and blue share one multiply (R and B lanes are
+    # 16 bits apart, so 8.8 fixed-point products can't carry into each other).
+    inv = 256 - t8
+    rb = (((a & 0xFF00FF) * inv + (b & 0xFF00FF) * t8) >> 8) & 0xFF00FF
+    g = (((a & 0x00FF00) * inv + (b & 0x00FF00) * t8) >> 8) & 0x00FF00
+    return f"#{rb | g:06x}"
+
+
 def is_port_open(host: str, port: int, timeout: float = 0.25) -> bool:
+    # Non-blocking connect + select: a refused connection comes back
+    # immediately instead of tying up a blocking connect() call.
     try:
-        with socket.create_connection((host, port), timeout=timeout):
-            return True
+        infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
     except OSError:
         return False
+    for family, type_, proto, _, addr in infos:
+        s = socket.socket(family, type_, proto)
+        try:
+            s.setblocking(False)
+            err = s.connect_ex(addr)
+            if err in (0, errno.EISCONN):
+                return True
+            # Windows answers WSAEWOULDBLOCK (10035), not errno.EWOULDBLOCK
+            wsa_would_block = getattr(errno, "WSAEWOULDBLOCK", None)
+            if err in (
+                errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EAGAIN, wsa_would_block
+            ):
+                # Windows reports a failed connect in the exceptional set
+                _, w, x = select.select([], [s], [s], timeout)
+                if w and not x:
+                    if s.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                        return True
+        except OSError:
+            pass
+        finally:
+            s.close()
+    return False
 
 
-@dataclass
+@dataclass(slots=True)
 class LogEvent:
     level: str  # "info" | "success" | "warning" | "error"
     message: str
     timestamp: str
 
 
+# "[INFO   ] "-style prefixes, formatted once rather than per rendered line
+LOG_LEVEL_LABELS = {
+    level: f"[{level.upper():7}] " for level in ("info", "success", "warning", "error")
+}
+
+
 # ---------------- APP ----------------
 class ViteControlCenter(ctk.CTk):
     COLORS = {
@@ -116,35 +287,87 @@ class ViteControlCenter(ctk.CTk):
 
         # State
         self.npm_path: str | None = None
+        # proc is only written by _server_thread (set) and stop_server (clear).
+        # Readers take one snapshot (p = self.proc) and see the old or the new
+        # reference, never a torn one, so reads need no lock.
         self.proc: subprocess.Popen | None = None
-        self.proc_lock = threading.Lock()
+        self._server_port: int | None = None  # port the current proc was given
+        # set by stop_server, cleared once _server_thread has waited it out
+        self._stopped_proc: subprocess.Popen | None = None
+        self._state_lock = threading.Lock()  # only for multi-field swaps
         self.stop_event = threading.Event()
 
         self.server_ready = False
-        self.server_start_time: datetime | None = None
+        self._server_start_mono: float | None = None
+        self._last_uptime_txt = ""
+        self._uptime_tick_id: str | None = None
         self.session_count = 0
+        self._private_browser: tuple[str, list[str]] | None = None  # (exe, flags)
 
-        self.log_q: "queue.Queue[LogEvent]" = queue.Queue()
+        # Producers append under _log_lock; the drain swaps the whole buffer out.
+        self._log_buf: deque[LogEvent] = deque(maxlen=LOG_QUEUE_MAX)
+        self._log_lock = threading.Lock()
+        self._dropped_logs = 0
+        self._log_pool: list[LogEvent] = []
+        self._filter_src = ""  # stripped filter text _filter_re was built from
+        self._filter_re: re.Pattern | None = None
+        self._log_notify_pending = False
 
         # Settings (interactive)
         self.host_var = tk.StringVar(value=DEFAULT_HOST)
         self.port_var = tk.StringVar(value=str(DEFAULT_PORT))
         self.auto_launch_var = tk.BooleanVar(value=True)
         self.incognito_var = tk.BooleanVar(value=True)
-
-        # Animation
+        self._url_cache: str | None = None
+        self._last_url_text = ""  # text url_label currently shows
+        self._pending_settings_refresh = False
+        self.host_var.trace_add("write", self._invalidate_url)
+        self.port_var.trace_add("write", self._invalidate_url)
+
+        # Animation (one shared ~60fps driver; tasks return False when finished)
+        self._anim_tasks: list[Callable[[float], bool]] = []
+        self._anim_tick_id: str | None = None
         self._pulse_phase = 0.0
         self._ambient_phase = 0.0
+        self._last_ambient = -1.0
+        self._last_rail_col: str | None = None
+        self._pulse_colors: dict[int, str] = {}  # quantized pulse level -> color
 
         # Page transition animation
         self._current_page_name: str | None = None
         self._transitioning = False
         self._page_anim_token = 0
+        self._page_container_w = 800  # kept current by <Configure>
+        # Eased progress for each ~16 ms frame of the fixed-length slide
+        n = int(PAGE_TRANSITION_S / 0.016) + 1
+        self._ease_table = [self._ease_out_cubic(i / (n - 1)) for i in range(n)]
 
         # Toast animation
         self._toast_y = 30
         self._toast_anim_token = 0
 
+        # Palette (blended variants of COLORS, computed once)
+        C = self.COLORS
+        self._palette = {
+            "nav_hover": self._blend(C["panel2"], "#ffffff", 0.04),
+            "ambient_track": self._blend(C["panel2"], "#000000", 0.2),
+            "nav_active": self._blend(C["accent"], "#000000", 0.25),
+            "accent_hover": self._blend(C["accent"], "#ffffff", 0.08),
+            "panel_raised": self._blend(C["panel"], "#ffffff", 0.04),
+            "panel_hover": self._blend(C["panel"], "#ffffff", 0.08),
+            "panel_hover_strong": self._blend(C["panel"], "#ffffff", 0.12),
+            "panel_sunken": self._blend(C["panel"], "#000000", 0.12),
+            "stat_card": self._blend(C["panel"], "#ffffff", 0.03),
+            "panel2_sunken": self._blend(C["panel2"], "#000000", 0.12),
+        }
+        # level -> (status dot, status/toast text color, rail label)
+        self._level_style = {
+            "success": (C["success"], C["success"], "Online"),
+            "warning": (C["warning"], C["warning"], "Starting"),
+            "error": (C["error"], C["error"], "Error"),
+            "info": (C["muted"], C["text"], "Info"),
+        }
+
         # Fonts
         family_ui = "Segoe UI Variable" if os.name == "nt" else "Helvetica"
         family_mono = "Consolas" if os.name == "nt" else "Menlo"
@@ -152,6 +375,12 @@ class ViteControlCenter(ctk.CTk):
         self.font_h2 = ctk.CTkFont(family=family_ui, size=14, weight="bold")
         self.font_body = ctk.CTkFont(family=family_ui, size=13)
         self.font_small = ctk.CTkFont(family=family_ui, size=11)
+        self.font_badge = ctk.CTkFont(size=15, weight="bold")
+        self.font_body_bold = ctk.CTkFont(size=13, weight="bold")
+        self.font_tiny_bold = ctk.CTkFont(size=12, weight="bold")
+        self.font_stat_label = ctk.CTkFont(size=10, weight="bold")
+        self.font_stat_value = ctk.CTkFont(size=16, weight="bold")
+        self.font_btn_bold = ctk.CTkFont(size=14, weight="bold")
         self.font_mono = (family_mono, 11)
 
         # UI
@@ -160,9 +389,9 @@ class ViteControlCenter(ctk.CTk):
         self._switch_page("Dashboard", animate=False)
 
         # Background loops
-        self.after(50, self._drain_logs)
-        self.after(16, self._animate)  # smoother UI animations
-        self.after(1000, self._tick_uptime)
+        self.bind("<<LogReady>>", self._drain_logs)
+        self._add_anim_task(self._animate)
+        self._uptime_tick_id = self.after(1000, self._tick_uptime)
 
         # Start server
         self.start_server()
@@ -196,7 +425,7 @@ class ViteControlCenter(ctk.CTk):
             badge,
             text="AI",
             text_color="white",
-            font=ctk.CTkFont(size=15, weight="bold"),
+            font=self.font_badge,
         ).place(relx=0.5, rely=0.5, anchor="center")
 
         titlebox = ctk.CTkFrame(brand, fg_color="transparent")
@@ -223,7 +452,7 @@ class ViteControlCenter(ctk.CTk):
                 height=42,
                 corner_radius=14,
                 fg_color="transparent",
-                hover_color=self._blend(self.COLORS["panel2"], "#ffffff", 0.04),
+                hover_color=self._palette["nav_hover"],
                 text_color=self.COLORS["muted"],
                 anchor="w",
                 command=lambda n=name: self._switch_page(n),
@@ -256,7 +485,7 @@ class ViteControlCenter(ctk.CTk):
             self.rail_status,
             text="Starting…",
             text_color=self.COLORS["muted"],
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=self.font_tiny_bold,
         )
         self.rail_status_label.pack(side="left", pady=12)
 
@@ -287,7 +516,7 @@ class ViteControlCenter(ctk.CTk):
             self.topbar,
             height=8,
             corner_radius=999,
-            fg_color=self._blend(self.COLORS["panel2"], "#000000", 0.2),
+            fg_color=self._palette["ambient_track"],
             progress_color=self.COLORS["accent"],
         )
         self.ambient.grid(row=1, column=0, sticky="ew", pady=(10, 0))
@@ -311,6 +540,7 @@ class ViteControlCenter(ctk.CTk):
         self.page_container.grid(row=1, column=0, sticky="nsew", padx=20, pady=(0, 20))
         self.page_container.grid_columnconfigure(0, weight=1)
         self.page_container.grid_rowconfigure(0, weight=1)
+        self.page_container.bind("<Configure>", self._on_page_container_resize)
 
     def _build_pages(self):
         self.pages: dict[str, ctk.CTkFrame] = {}
@@ -328,10 +558,12 @@ class ViteControlCenter(ctk.CTk):
         t = max(0.0, min(1.0, t))
         return 1 - (1 - t) ** 3
 
+    def _on_page_container_resize(self, event):
+        if event.width > 10:
+            self._page_container_w = event.width
+
     def _page_width(self) -> int:
-        self.update_idletasks()
-        w = int(self.page_container.winfo_width())
-        return w if w > 10 else 800
+        return self._page_container_w
 
     def _show_page_instant(self, name: str):
         for p in self.pages.values():
@@ -343,6 +575,17 @@ class ViteControlCenter(ctk.CTk):
         if from_name == to_name:
             return
 
+        # Nobody is watching (minimized, hidden or unfocused): skip the frames.
+        if (
+            self.state() == "iconic"
+            or not self.winfo_viewable()
+            or self.focus_displayof() is None
+        ):
+            self._page_anim_token += 1
+            self._transitioning = False
+            self._show_page_instant(to_name)
+            return
+
         # If a transition is already running, cancel it and fall back to instant switch
         # (prevents mid-transition weirdness and keeps things feeling smooth).
         if self._transitioning:
@@ -363,46 +606,41 @@ class ViteControlCenter(ctk.CTk):
         to_page.place(x=w, y=0, relwidth=1, relheight=1)
 
         start = time.perf_counter()
-        duration = 0.26  # seconds
+        duration = PAGE_TRANSITION_S
+        ease = self._ease_table
+        last = len(ease) - 1
 
-        def frame():
+        def frame(now: float) -> bool:
             if token != self._page_anim_token:
                 self._transitioning = False
-                return
+                return False
 
-            t = (time.perf_counter() - start) / duration
+            t = (now - start) / duration
             if t >= 1.0:
                 from_page.place_forget()
                 to_page.place_configure(x=0)
                 self._current_page_name = to_name
                 self._transitioning = False
-                return
+                return False
 
-            e = self._ease_out_cubic(t)
+            e = ease[int(t * last)]
             x_from = int(-w * e)  # 0 -> -w
             x_to = int(w * (1.0 - e))  # w -> 0
 
             from_page.place_configure(x=x_from)
             to_page.place_configure(x=x_to)
+            return True
 
-            self.after(16, frame)  # ~60fps
-
-        frame()
+        self._add_anim_task(frame)
 
     def _switch_page(self, name: str, animate: bool = True):
+        active_fg = self._palette["nav_active"]
+        idle_text = self.COLORS["muted"]
         for k, btn in self.nav_buttons.items():
             if k == name:
-                btn.configure(
-                    fg_color=self._blend(self.COLORS["accent"], "#000000", 0.25),
-                    text_color="white",
-                    hover=False,
-                )
+                btn.configure(fg_color=active_fg, text_color="white", hover=False)
             else:
-                btn.configure(
-                    fg_color="transparent",
-                    text_color=self.COLORS["muted"],
-                    hover=True,
-                )
+                btn.configure(fg_color="transparent", text_color=idle_text, hover=True)
 
         self.page_title.configure(text=name)
 
@@ -442,10 +680,11 @@ class ViteControlCenter(ctk.CTk):
         )
         self.hero_status.grid(row=0, column=0, sticky="w")
 
+        self._last_url_text = self.current_url()
         self.url_label = ctk.CTkLabel(
             top,
-            text=self.current_url(),
-            font=ctk.CTkFont(size=12, weight="bold"),
+            text=self._last_url_text,
+            font=self.font_tiny_bold,
             text_color=self.COLORS["muted"],
         )
         self.url_label.grid(row=1, column=0, sticky="w", pady=(6, 0))
@@ -483,9 +722,9 @@ class ViteControlCenter(ctk.CTk):
             height=44,
             corner_radius=16,
             fg_color=self.COLORS["accent"],
-            hover_color=self._blend(self.COLORS["accent"], "#ffffff", 0.08),
+            hover_color=self._palette["accent_hover"],
             text_color="white",
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=self.font_body_bold,
             command=self.launch_session,
             state="disabled",
         )
@@ -496,8 +735,8 @@ class ViteControlCenter(ctk.CTk):
             text="Copy URL",
             height=40,
             corner_radius=16,
-            fg_color=self._blend(self.COLORS["panel"], "#ffffff", 0.04),
-            hover_color=self._blend(self.COLORS["panel"], "#ffffff", 0.08),
+            fg_color=self._palette["panel_raised"],
+            hover_color=self._palette["panel_hover"],
             text_color=self.COLORS["text"],
             font=self.font_body,
             command=self.copy_url,
@@ -509,8 +748,8 @@ class ViteControlCenter(ctk.CTk):
             text="Restart Server",
             height=40,
             corner_radius=16,
-            fg_color=self._blend(self.COLORS["panel"], "#ffffff", 0.04),
-            hover_color=self._blend(self.COLORS["panel"], "#ffffff", 0.08),
+            fg_color=self._palette["panel_raised"],
+            hover_color=self._palette["panel_hover"],
             text_color=self.COLORS["text"],
             font=self.font_body,
             command=self.restart_server,
@@ -549,7 +788,7 @@ class ViteControlCenter(ctk.CTk):
         self.timeline_list = ctk.CTkScrollableFrame(
             timeline,
             corner_radius=16,
-            fg_color=self._blend(self.COLORS["panel"], "#000000", 0.12),
+            fg_color=self._palette["panel_sunken"],
         )
         self.timeline_list.grid(row=1, column=0, sticky="nsew", padx=16, pady=(0, 16))
 
@@ -559,7 +798,7 @@ class ViteControlCenter(ctk.CTk):
         card = ctk.CTkFrame(
             parent,
             corner_radius=16,
-            fg_color=self._blend(self.COLORS["panel"], "#ffffff", 0.03),
+            fg_color=self._palette["stat_card"],
             border_width=1,
             border_color=self.COLORS["border"],
         )
@@ -567,13 +806,13 @@ class ViteControlCenter(ctk.CTk):
         ctk.CTkLabel(
             card,
             text=label.upper(),
-            font=ctk.CTkFont(size=10, weight="bold"),
+            font=self.font_stat_label,
             text_color=self.COLORS["muted"],
         ).pack(anchor="w", padx=12, pady=(10, 0))
         val = ctk.CTkLabel(
             card,
             text=value,
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=self.font_stat_value,
             text_color=self.COLORS["text"],
         )
         val.pack(anchor="w", padx=12, pady=(4, 10))
@@ -600,6 +839,7 @@ class ViteControlCenter(ctk.CTk):
         ).grid(row=0, column=0, sticky="w", padx=16, pady=14)
 
         self.log_filter_var = tk.StringVar(value="")
+        self.log_filter_var.trace_add("write", self._on_filter_changed)
         self.log_filter = ctk.CTkEntry(
             toolbar,
             textvariable=self.log_filter_var,
@@ -615,8 +855,8 @@ class ViteControlCenter(ctk.CTk):
             height=36,
             width=90,
             corner_radius=14,
-            fg_color=self._blend(self.COLORS["panel"], "#ffffff", 0.04),
-            hover_color=self._blend(self.COLORS["panel"], "#ffffff", 0.08),
+            fg_color=self._palette["panel_raised"],
+            hover_color=self._palette["panel_hover"],
             command=self.clear_logs,
         ).grid(row=0, column=2, sticky="e", padx=(0, 16), pady=14)
 
@@ -642,6 +882,7 @@ class ViteControlCenter(ctk.CTk):
             bg=self.COLORS["panel"],
             fg=self.COLORS["muted"],
             insertbackground=self.COLORS["text"],
+            insertontime=0,  # stays in "normal" state; hide the caret anyway
             relief="flat",
             highlightthickness=0,
             wrap="word",
@@ -660,10 +901,34 @@ class ViteControlCenter(ctk.CTk):
         self.log_text.tag_configure("warning", foreground=self.COLORS["warning"])
         self.log_text.tag_configure("error", foreground=self.COLORS["error"])
 
-        self.log_text.configure(state="disabled")
+        # Read-only at the event level, so appends don't need state toggles.
+        self.log_text.bind("<Key>", self._block_log_edit)
+        for seq in ("<<Paste>>", "<<PasteSelection>>", "<<Cut>>", "<<Clear>>"):
+            self.log_text.bind(seq, lambda e: "break")
 
         return page
 
+    def _block_log_edit(self, event):
+        # Let copy/select-all and navigation through, keep Tab moving focus
+        # as it did while the widget was disabled; swallow everything else.
+        # Returning None lets the key reach the Text class tag, whose bindings
+        # raise <<Copy>> and <<SelectAll>>.
+        if event.state & (0x0004 | 0x0008) and event.keysym.lower() in ("c", "a"):
+            return None
+        if event.keysym in (
+            "Left", "Right", "Up", "Down", "Prior", "Next", "Home", "End"
+        ):
+            return None
+        if event.keysym in ("Tab", "ISO_Left_Tab"):
+            # The Text class binding would insert "\t" here, so traverse by hand
+            if event.keysym == "ISO_Left_Tab" or event.state & 0x0001:
+                target = event.widget.tk_focusPrev()
+            else:
+                target = event.widget.tk_focusNext()
+            if target is not None:
+                target.focus_set()
+        return "break"
+
     # --------- Settings ----------
     def _build_settings(self, parent: ctk.CTkFrame) -> ctk.CTkFrame:
         page = ctk.CTkFrame(parent, fg_color="transparent")
@@ -734,7 +999,7 @@ class ViteControlCenter(ctk.CTk):
             height=40,
             corner_radius=16,
             fg_color=self.COLORS["accent"],
-            hover_color=self._blend(self.COLORS["accent"], "#ffffff", 0.08),
+            hover_color=self._palette["accent_hover"],
             command=self.apply_settings_and_restart,
         ).grid(row=0, column=0, sticky="w")
 
@@ -743,8 +1008,8 @@ class ViteControlCenter(ctk.CTk):
             text="Stop Server",
             height=40,
             corner_radius=16,
-            fg_color=self._blend(self.COLORS["panel"], "#ffffff", 0.04),
-            hover_color=self._blend(self.COLORS["panel"], "#ffffff", 0.08),
+            fg_color=self._palette["panel_raised"],
+            hover_color=self._palette["panel_hover"],
             command=self.stop_server,
         ).grid(row=0, column=1, sticky="e")
 
@@ -776,27 +1041,53 @@ class ViteControlCenter(ctk.CTk):
 
     # --------- Core server behavior ----------
     def current_url(self) -> str:
+        if self._url_cache is not None:
+            return self._url_cache
         host = (self.host_var.get() or DEFAULT_HOST).strip()
         port_s = (self.port_var.get() or str(DEFAULT_PORT)).strip()
         try:
             port = int(port_s)
         except ValueError:
             port = DEFAULT_PORT
-        return f"http://{host}:{port}/"
+        self._url_cache = f"http://{host}:{port}/"
+        return self._url_cache
+
+    def _invalidate_url(self, *_):
+        self._url_cache = None
+        self._schedule_settings_refresh()
+
+    def _schedule_settings_refresh(self):
+        # Coalesce a burst of keystrokes into one UI update per 150 ms.
+        if not self._pending_settings_refresh:
+            self._pending_settings_refresh = True
+            self.after(150, self._do_settings_refresh)
+
+    def _do_settings_refresh(self):
+        self._pending_settings_refresh = False
+        self._sync_url_label()
+
+    def _sync_url_label(self) -> str:
+        # Tk configure only when the (cached) URL actually differs.
+        url = self.current_url()
+        if url != self._last_url_text:
+            self._last_url_text = url
+            self.url_label.configure(text=url)
+        return url
 
     def _dev_args(self) -> list[str]:
         host = (self.host_var.get() or DEFAULT_HOST).strip()
         port = int((self.port_var.get() or str(DEFAULT_PORT)).strip())
-        return DEV_ARGS_BASE + ["--host", host, "--port", str(port)]
+        # --strictPort: fail on a taken port instead of moving to the next one
+        return DEV_ARGS_BASE + ["--host", host, "--port", str(port), "--strictPort"]
 
     def start_server(self):
-        with self.proc_lock:
-            if self.proc and self.proc.poll() is None:
-                self.toast_msg("Server already running.", level="warning")
-                return
+        p = self.proc
+        if p and p.poll() is None:
+            self.toast_msg("Server already running.", level="warning")
+            return
 
         self.server_ready = False
-        self.server_start_time = None
+        self._server_start_mono = None
         self._set_status("Starting", "Warming up Vite…", level="warning")
 
         self.npm_path = resolve_npm_path()
@@ -833,6 +1124,32 @@ class ViteControlCenter(ctk.CTk):
                 return
             self.enqueue_log("success", "Dependencies installed.")
 
+        host = (self.host_var.get() or DEFAULT_HOST).strip()
+        port = int((self.port_var.get() or str(DEFAULT_PORT)).strip())
+
+        # On restart, stop_server has only signalled the old server; give it
+        # time to exit and release its listener before checking the port.
+        prev = self._stopped_proc
+        if prev is not None:
+            try:
+                prev.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                pass
+            deadline = time.monotonic() + 2.0
+            while is_port_open(host, port) and time.monotonic() < deadline:
+                time.sleep(0.05)
+            with self._state_lock:
+                if self._stopped_proc is prev:
+                    self._stopped_proc = None  # waited out; later starts skip this
+            if self.stop_event.is_set():
+                return  # stopped again while waiting
+
+        # One-shot port conflict check (readiness itself comes from Vite's output)
+        if is_port_open(host, port):
+            self._set_status("Error", f"Port {port} is already in use.", level="error")
+            self.enqueue_log("error", f"Port {port} is already in use on {host}.")
+            return
+
         # Start Vite server
         cmd = npm_cmd(self.npm_path, self._dev_args())
         self.enqueue_log("info", "Starting Vite dev server…")
@@ -842,7 +1159,10 @@ class ViteControlCenter(ctk.CTk):
         if os.name == "nt":
             kwargs["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
         else:
-            kwargs["preexec_fn"] = os.setsid
+            # setsid() in C instead of a Python preexec_fn, and no fd-closing
+            # sweep (Python's own fds are non-inheritable anyway).
+            kwargs["start_new_session"] = True
+            kwargs["close_fds"] = False
 
         try:
             p = subprocess.Popen(
@@ -850,107 +1170,212 @@ class ViteControlCenter(ctk.CTk):
                 cwd=PROJECT_ROOT,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
                 **kwargs,
             )
         except Exception as e:
             self._set_status("Error", f"Failed to start server: {e}", level="error")
             return
 
-        with self.proc_lock:
+        with self._state_lock:
             self.proc = p
-        self.server_start_time = datetime.now()
+            self._server_port = port
+            self._server_start_mono = time.monotonic()
+        self.after(0, self._restart_uptime_tick)  # don't wait out a long tick
 
-        threading.Thread(
-            target=self._stream_proc_output, args=(p,), daemon=True
-        ).start()
+        if os.name == "nt":
+            # Tk has no file handlers on Windows, so a thread reads the pipe.
+            threading.Thread(
+                target=self._supervise_proc, args=(p,), daemon=True
+            ).start()
+        else:
+            self.after(0, self._watch_proc, p)
         threading.Thread(target=self._ready_monitor, daemon=True).start()
 
     def _run_and_stream(self, cmd: list[str], cwd: Path) -> int:
+        kwargs = {} if os.name == "nt" else {"close_fds": False}
         try:
             p = subprocess.Popen(
                 cmd,
                 cwd=cwd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
+                **kwargs,
             )
         except Exception as e:
             self.enqueue_log("error", f"Failed to run command: {e}")
             return 1
 
         assert p.stdout is not None
-        for line in p.stdout:
+        for lines in iter_pipe_batches(p.stdout.fileno()):
             if self.stop_event.is_set():
                 break
-            s = line.rstrip()
-            if s:
-                self.enqueue_log("info", s)
+            messages = []
+            for line in lines:
+                if b"\x1b" in line:
+                    line = ANSI_RE.sub(b"", line)
+                s = line.decode("utf-8", "replace").rstrip()
+                if s:
+                    messages.append(s)
+            self.enqueue_logs("info", messages)
 
         try:
             return p.wait(timeout=5)
         except Exception:
             return 1
 
-    def _stream_proc_output(self, p: subprocess.Popen):
-        if not p.stdout:
-            return
-        for line in p.stdout:
+    def _emit_proc_lines(self, lines: list[bytes], ready_seen: bool) -> bool:
+        # Strip colors, watch for Vite's ready banner, queue the batch.
+        messages = []
+        for line in lines:
+            if b"\x1b" in line:
+                line = ANSI_RE.sub(b"", line)
+            if not ready_seen:
+                # Only the configured port counts as ready
+                m = VITE_READY_RE.search(line)
+                if m and int(m[1]) == self._server_port:
+                    ready_seen = True
+                    self.after(0, self._on_server_ready)
+            s = line.decode("utf-8", "replace").rstrip()
+            if s:
+                messages.append(s)
+        self.enqueue_logs("info", messages)
+        return ready_seen
+
+    def _watch_proc(self, p: subprocess.Popen):
+        # POSIX: Tk's event loop waits on the output pipe (and, on Linux, a
+        # pidfd for the process), so output is read on the UI thread as it
+        # arrives, with no reader thread and no polling.
+        fd = p.stdout.fileno()
+        os.set_blocking(fd, False)
+        pidfd = None
+        if hasattr(os, "pidfd_open"):
+            try:
+                pidfd = os.pidfd_open(p.pid)
+            except OSError:
+                pidfd = None
+        watched = set()
+        buf = bytearray()
+        ready_seen = False
+
+        def unwatch(f):
+            if f in watched:
+                watched.discard(f)
+                self.tk.deletefilehandler(f)
+                if f == pidfd:
+                    os.close(f)
+
+        def flush_partial():
+            # Emit a trailing line that never got its newline
+            nonlocal ready_seen
+            if buf:
+                ready_seen = self._emit_proc_lines([bytes(buf)], ready_seen)
+                buf.clear()
+
+        def read_once() -> bool:
+            # One non-blocking read; False once nothing more is coming.
+            nonlocal buf, ready_seen
+            try:
+                chunk = os.read(fd, PIPE_READ_SIZE)
+            except BlockingIOError:
+                return False
+            except OSError:
+                chunk = b""
+            if not chunk:
+                unwatch(fd)
+                flush_partial()
+                return False
+            buf += chunk
+            lines = pop_lines(buf)
+            if lines:
+                ready_seen = self._emit_proc_lines(lines, ready_seen)
+            return True
+
+        def on_output(_f, _mask):
             if self.stop_event.is_set():
+                for f in tuple(watched):
+                    unwatch(f)
                 return
-            s = line.rstrip()
-            if s:
-                self.enqueue_log("info", s)
+            if read_once() or fd in watched:
+                return
+            # EOF: wait for the exit itself
+            if pidfd is None:
+                threading.Thread(
+                    target=lambda: self._on_proc_exit(p, wait_for_exit(p)),
+                    daemon=True,
+                ).start()
+
+        def on_exit(_f, _mask):
+            unwatch(pidfd)
+            # Take whatever is still readable; a grandchild may hold the
+            # pipe open, so don't wait for EOF.
+            while fd in watched and read_once():
+                pass
+            flush_partial()
+            unwatch(fd)
+            self._on_proc_exit(p, p.wait())
+
+        watched.add(fd)
+        self.tk.createfilehandler(fd, tk.READABLE, on_output)
+        if pidfd is not None:
+            watched.add(pidfd)
+            self.tk.createfilehandler(pidfd, tk.READABLE, on_exit)
+
+    def _supervise_proc(self, p: subprocess.Popen):
+        # Windows: one thread per server streams output and notices exit.
+        if p.stdout:
+            ready_seen = False
+            for lines in iter_pipe_batches(p.stdout.fileno()):
+                if self.stop_event.is_set():
+                    return
+                ready_seen = self._emit_proc_lines(lines, ready_seen)
+        self._on_proc_exit(p, wait_for_exit(p))
+
+    def _on_proc_exit(self, p: subprocess.Popen, rc: int):
+        if self.stop_event.is_set() or self.proc is not p:
+            return  # stopped on purpose
+        self.server_ready = False
+        self.enqueue_log("error", f"Server exited (code {rc}).")
+        self._set_status("Error", "Server exited unexpectedly.", level="error")
 
     def _ready_monitor(self):
-        url = self.current_url()
+        # Fallback only: the "Local:" banner in _emit_proc_lines normally
+        # flips readiness first, which ends this loop.
         host = (self.host_var.get() or DEFAULT_HOST).strip()
         port = int((self.port_var.get() or str(DEFAULT_PORT)).strip())
 
-        while not self.stop_event.is_set():
-            with self.proc_lock:
-                p = self.proc
-            if not p:
-                return
-            if p.poll() is not None:
-                self._set_status("Error", "Server exited unexpectedly.", level="error")
-                return
-
-            if is_port_open(host, port, timeout=0.2):
-                break
-            time.sleep(0.2)
+        # A closed port fails fast, so probe HTTP directly and back off
+        # 50 ms -> 1.5 s between attempts.
+        delay = 0.05
+        while not self.stop_event.is_set() and not self.server_ready:
+            p = self.proc
+            if not p or p.poll() is not None:
+                return  # _on_proc_exit reports unexpected exits
 
-        while not self.stop_event.is_set():
-            with self.proc_lock:
-                p = self.proc
-            if not p:
-                return
-            if p.poll() is not None:
-                self._set_status("Error", "Server exited unexpectedly.", level="error")
+            status = http_head_status(host, port)
+            if status is not None and 200 <= status < 500:
+                self.after(0, self._on_server_ready)
                 return
 
-            try:
-                with urllib.request.urlopen(url, timeout=0.8) as r:
-                    status = getattr(r, "status", 200)
-                    if 200 <= status < 500:
-                        self.server_ready = True
-                        self._set_status("Active", "Server online", level="success")
-                        self.enqueue_log("success", f"Server ready: {url}")
-                        if self.auto_launch_var.get():
-                            self.after(0, self.launch_session)
-                        return
-            except Exception:
-                pass
+            time.sleep(delay)
+            delay = min(delay * 2, 1.5)
 
-            time.sleep(0.4)
+    def _on_server_ready(self):
+        if self.server_ready:
+            return
+        self.server_ready = True
+        self._set_status("Active", "Server online", level="success")
+        self.enqueue_log("success", f"Server ready: {self.current_url()}")
+        if self.auto_launch_var.get():
+            self.after(0, self.launch_session)
 
     def stop_server(self):
         self.stop_event.set()
-        with self.proc_lock:
+        with self._state_lock:
             p = self.proc
             self.proc = None
+            self.server_ready = False
+            if p is not None:
+                self._stopped_proc = p
 
         if not p:
             self._set_status("Stopped", "Server is not running.", level="warning")
@@ -960,12 +1385,9 @@ class ViteControlCenter(ctk.CTk):
 
         try:
             if os.name == "nt":
-                subprocess.run(
-                    ["taskkill", "/PID", str(p.pid), "/T", "/F"],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                    check=False,
-                )
+                # Waiting out Ctrl+Break must not block the UI. Not a daemon
+                # thread, so closing the window still finishes the kill.
+                threading.Thread(target=stop_tree_nt, args=(p,)).start()
             else:
                 try:
                     os.killpg(os.getpgid(p.pid), signal.SIGTERM)
@@ -974,7 +1396,6 @@ class ViteControlCenter(ctk.CTk):
         except Exception as e:
             self.enqueue_log("warning", f"Stop error: {e}")
 
-        self.server_ready = False
         self._set_status("Stopped", "Server stopped.", level="warning")
         self.after(0, lambda: self.btn_new_session.configure(state="disabled"))
 
@@ -999,7 +1420,7 @@ class ViteControlCenter(ctk.CTk):
             self.toast_msg("Port must be an integer 1–65535.", level="error")
             return
 
-        self.url_label.configure(text=self.current_url())
+        self._sync_url_label()
         self.enqueue_log("info", f"Settings applied: host={host}, port={port}")
         self.restart_server()
 
@@ -1009,8 +1430,7 @@ class ViteControlCenter(ctk.CTk):
             self.toast_msg("Server not ready yet.", level="warning")
             return
 
-        url = self.current_url()
-        self.url_label.configure(text=url)
+        url = self._sync_url_label()
 
         # Show dialog to ask user preference
         choice = self._ask_browser_mode()
@@ -1036,7 +1456,7 @@ class ViteControlCenter(ctk.CTk):
         entry = ctk.CTkFrame(
             self.timeline_list,
             corner_radius=14,
-            fg_color=self._blend(self.COLORS["panel2"], "#000000", 0.12),
+            fg_color=self._palette["panel2_sunken"],
             border_width=1,
             border_color=self.COLORS["border"],
         )
@@ -1048,7 +1468,7 @@ class ViteControlCenter(ctk.CTk):
         ctk.CTkLabel(
             left,
             text=f"Session #{self.session_count}",
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=self.font_body_bold,
             text_color=self.COLORS["text"],
         ).pack(anchor="w")
         ctk.CTkLabel(
@@ -1061,8 +1481,8 @@ class ViteControlCenter(ctk.CTk):
             width=72,
             height=32,
             corner_radius=12,
-            fg_color=self._blend(self.COLORS["panel"], "#ffffff", 0.04),
-            hover_color=self._blend(self.COLORS["panel"], "#ffffff", 0.08),
+            fg_color=self._palette["panel_raised"],
+            hover_color=self._palette["panel_hover"],
             command=lambda u=url: webbrowser.open(u),
         ).pack(side="right", padx=10, pady=10)
 
@@ -1075,21 +1495,18 @@ class ViteControlCenter(ctk.CTk):
         Show a dialog asking user to choose between Incognito and Regular mode.
         Returns: "incognito", "regular", or None if canceled
         """
+        # Center over the main window; the dialog size is fixed, so no need
+        # to lay it out first to measure it.
+        x = self.winfo_x() + (self.winfo_width() // 2) - (420 // 2)
+        y = self.winfo_y() + (self.winfo_height() // 2) - (220 // 2)
+
         dialog = ctk.CTkToplevel(self)
+        dialog.withdraw()  # build off-screen, show once complete
         dialog.title("Browser Mode")
-        dialog.geometry("420x220")
+        dialog.geometry(f"420x220+{x}+{y}")
         dialog.resizable(False, False)
         dialog.configure(fg_color=self.COLORS["bg"])
-        
-        # Make it modal
         dialog.transient(self)
-        dialog.grab_set()
-        
-        # Center the dialog
-        dialog.update_idletasks()
-        x = self.winfo_x() + (self.winfo_width() // 2) - (420 // 2)
-        y = self.winfo_y() + (self.winfo_height() // 2) - (220 // 2)
-        dialog.geometry(f"+{x}+{y}")
         
         result = {"choice": None}
         
@@ -1139,9 +1556,9 @@ class ViteControlCenter(ctk.CTk):
             height=50,
             corner_radius=16,
             fg_color=self.COLORS["accent"],
-            hover_color=self._blend(self.COLORS["accent"], "#ffffff", 0.08),
+            hover_color=self._palette["accent_hover"],
             text_color="white",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self.font_btn_bold,
             command=choose_incognito,
         ).grid(row=0, column=0, sticky="ew", padx=(0, 5))
         
@@ -1151,67 +1568,97 @@ class ViteControlCenter(ctk.CTk):
             text="🌐 Regular",
             height=50,
             corner_radius=16,
-            fg_color=self._blend(self.COLORS["panel"], "#ffffff", 0.08),
-            hover_color=self._blend(self.COLORS["panel"], "#ffffff", 0.12),
+            fg_color=self._palette["panel_hover"],
+            hover_color=self._palette["panel_hover_strong"],
             text_color=self.COLORS["text"],
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self.font_btn_bold,
             command=choose_regular,
         ).grid(row=0, column=1, sticky="ew", padx=(5, 0))
         
+        # Show and make it modal
+        dialog.deiconify()
+        dialog.grab_set()
+
         # Wait for dialog to close
         dialog.wait_window()
         
         return result["choice"]
 
     def _open_private_window(self, url: str) -> bool:
+        if self._private_browser is None:
+            self._private_browser = self._find_private_browser()
+            if self._private_browser is None:
+                return False
+
+        exe, flags = self._private_browser
+        try:
+            subprocess.Popen([exe, *flags, url])
+            return True
+        except OSError:
+            self._private_browser = None  # moved/uninstalled; rescan next time
+            return False
+
+    def _find_private_browser(self) -> tuple[str, list[str]] | None:
+        incognito = ["--incognito", "--disable-features=BlockThirdPartyCookies"]
+        inprivate = ["--inprivate", "--disable-features=BlockThirdPartyCookies"]
+
+        # Anything on PATH first (covers non-standard installs)
+        for name, flags in [
+            ("google-chrome", incognito),
+            ("chrome", incognito),
+            ("chromium", incognito),
+            ("chromium-browser", incognito),
+            ("msedge", inprivate),
+            ("microsoft-edge", inprivate),
+        ]:
+            found = shutil.which(name)
+            if found:
+                return found, flags
+
         candidates: list[tuple[str, list[str]]] = []
 
         # Windows
         candidates += [
             (
                 r"C:\Program Files\Google\Chrome\Application\chrome.exe",
-                ["--incognito", "--disable-features=BlockThirdPartyCookies", url],
+                incognito,
             ),
             (
                 r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
-                ["--incognito", "--disable-features=BlockThirdPartyCookies", url],
+                incognito,
             ),
             (
                 r"C:\Program Files (x86)\Microsoft\Edge\Application\msedge.exe",
-                ["--inprivate", "--disable-features=BlockThirdPartyCookies", url],
+                inprivate,
             ),
             (
                 r"C:\Program Files\Microsoft\Edge\Application\msedge.exe",
-                ["--inprivate", "--disable-features=BlockThirdPartyCookies", url],
+                inprivate,
             ),
         ]
         # macOS
         candidates += [
             (
                 "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
-                ["--incognito", "--disable-features=BlockThirdPartyCookies", url],
+                incognito,
             ),
             (
                 "/Applications/Microsoft Edge.app/Contents/MacOS/Microsoft Edge",
-                ["--inprivate", "--disable-features=BlockThirdPartyCookies", url],
+                inprivate,
             ),
         ]
         # Linux
         candidates += [
-            ("/usr/bin/google-chrome", ["--incognito", "--disable-features=BlockThirdPartyCookies", url]),
-            ("/usr/bin/chromium", ["--incognito", "--disable-features=BlockThirdPartyCookies", url]),
-            ("/usr/bin/chromium-browser", ["--incognito", "--disable-features=BlockThirdPartyCookies", url]),
-            ("/usr/bin/microsoft-edge", ["--inprivate", "--disable-features=BlockThirdPartyCookies", url]),
+            ("/usr/bin/google-chrome", incognito),
+            ("/usr/bin/chromium", incognito),
+            ("/usr/bin/chromium-browser", incognito),
+            ("/usr/bin/microsoft-edge", inprivate),
         ]
 
-        for exe, args in candidates:
+        for exe, flags in candidates:
             if os.path.exists(exe):
-                try:
-                    subprocess.Popen([exe, *args])
-                    return True
-                except Exception:
-                    continue
-        return False
+                return exe, flags
+        return None
 
     def copy_url(self):
         url = self.current_url()
@@ -1228,28 +1675,14 @@ class ViteControlCenter(ctk.CTk):
             self.stat_state.configure(text=state_text)
             self.hero_status.configure(text=hero_text)
 
-            if level == "success":
-                dot = self.COLORS["success"]
-                txt = self.COLORS["success"]
-                rail = "Online"
-            elif level == "warning":
-                dot = self.COLORS["warning"]
-                txt = self.COLORS["warning"]
-                rail = "Starting"
-            elif level == "error":
-                dot = self.COLORS["error"]
-                txt = self.COLORS["error"]
-                rail = "Error"
-            else:
-                dot = self.COLORS["muted"]
-                txt = self.COLORS["text"]
-                rail = "Info"
+            dot, txt, rail = self._level_style.get(level, self._level_style["info"])
 
             self.rail_dot.configure(fg_color=dot)
+            self._last_rail_col = dot
             self.rail_status_label.configure(text=rail, text_color=self.COLORS["muted"])
             self.hero_status.configure(text_color=txt)
 
-            self.url_label.configure(text=self.current_url())
+            self._sync_url_label()
 
             if self.server_ready:
                 self.btn_new_session.configure(state="normal")
@@ -1262,76 +1695,106 @@ class ViteControlCenter(ctk.CTk):
         self.after(0, apply)
 
     def _tick_uptime(self):
-        if self.server_start_time:
-            delta = datetime.now() - self.server_start_time
-            s = int(delta.total_seconds())
+        delay = 1000
+        start = self._server_start_mono
+        if start is not None:
+            s = int(time.monotonic() - start)
             if s < 60:
                 txt = f"{s}s"
             elif s < 3600:
                 txt = f"{s // 60}m {s % 60}s"
             else:
                 txt = f"{s // 3600}h {(s % 3600) // 60}m"
-            self.stat_uptime.configure(text=txt)
-        self.after(1000, self._tick_uptime)
+                # Only minutes are shown past an hour: sleep to the next one.
+                delay = 60000 - (s % 60) * 1000
+            if txt != self._last_uptime_txt:
+                self._last_uptime_txt = txt
+                self.stat_uptime.configure(text=txt)
+        self._uptime_tick_id = self.after(delay, self._tick_uptime)
+
+    def _restart_uptime_tick(self):
+        if self._uptime_tick_id is not None:
+            self.after_cancel(self._uptime_tick_id)
+        self._tick_uptime()
+
+    # --------- Animation driver ----------
+    def _add_anim_task(self, task: Callable[[float], bool]):
+        self._anim_tasks.append(task)
+        if self._anim_tick_id is None:
+            self._anim_tick_id = self.after(16, self._master_tick)
+
+    def _master_tick(self):
+        # Single Tk callback per frame for every running animation.
+        now = time.perf_counter()
+        self._anim_tasks = [task for task in self._anim_tasks if task(now)]
+        if self._anim_tasks:
+            # ~60fps while on screen; a slow heartbeat when minimized/hidden.
+            delay = 16 if self.winfo_viewable() else 200
+            self._anim_tick_id = self.after(delay, self._master_tick)
+        else:
+            self._anim_tick_id = None
 
-    def _animate(self):
+    def _animate(self, now: float) -> bool:
         # Ambient top bar “breath” (smooth sine)
         self._ambient_phase += 0.02
-        v = 0.55 + 0.25 * math.sin(time.time() * 0.9)  # 0.30..0.80
+        v = 0.55 + 0.25 * math.sin(now * 0.9)  # 0.30..0.80
         v = max(0.0, min(1.0, v))
-        self.ambient.set(v)
+        if abs(v - self._last_ambient) >= 0.01:
+            self._last_ambient = v
+            self.ambient.set(v)
 
         # Pulse the rail dot gently when ready
         if self.server_ready:
             self._pulse_phase += 0.12
-            t = (1.0 + math.sin(self._pulse_phase)) / 2.0
-            col = self._blend(self.COLORS["success"], "#b8ffcf", 0.18 * t)
-            self.rail_dot.configure(fg_color=col)
+            q = int((1.0 + math.sin(self._pulse_phase)) * 127.5)  # 0..255
+            col = self._pulse_colors.get(q)
+            if col is None:
+                col = self._blend(self.COLORS["success"], "#b8ffcf", 0.18 * q / 255)
+                self._pulse_colors[q] = col
+            if col != self._last_rail_col:
+                self._last_rail_col = col
+                self.rail_dot.configure(fg_color=col)
 
-        self.after(16, self._animate)
+        return True
 
     # --------- Toast animation ----------
     def _animate_toast_y(self, start_y: int, end_y: int, ms: int = 200, on_done=None):
         self._toast_anim_token += 1
         token = self._toast_anim_token
 
-        start = time.perf_counter()
         duration = max(0.08, ms / 1000.0)
+        # Endpoints and duration are fixed, so precompute every keyframe.
+        n = max(1, int(duration / 0.016))
+        dy = end_y - start_y
+        ys = [int(start_y + dy * self._ease_out_cubic(i / n)) for i in range(n)]
+        frames_per_s = n / duration
+        start = time.perf_counter()
 
-        def frame():
+        def frame(now: float) -> bool:
             if token != self._toast_anim_token:
-                return
+                return False
 
-            t = (time.perf_counter() - start) / duration
-            if t >= 1.0:
+            i = int((now - start) * frames_per_s)
+            if i >= n:
                 self._toast_y = end_y
                 if self.toast_visible:
                     self.toast.place_configure(y=end_y)
                 if on_done:
                     on_done()
-                return
+                return False
 
-            e = self._ease_out_cubic(t)
-            y = int(start_y + (end_y - start_y) * e)
+            y = ys[i]
             self._toast_y = y
 
             if self.toast_visible:
                 self.toast.place_configure(y=y)
+            return True
 
-            self.after(16, frame)
-
-        frame()
+        self._add_anim_task(frame)
 
     def toast_msg(self, msg: str, level: str = "info"):
         bg = self.COLORS["panel2"]
-        if level == "success":
-            fg = self.COLORS["success"]
-        elif level == "warning":
-            fg = self.COLORS["warning"]
-        elif level == "error":
-            fg = self.COLORS["error"]
-        else:
-            fg = self.COLORS["text"]
+        fg = self._level_style.get(level, self._level_style["info"])[1]
 
         self.toast.configure(text=msg, text_color=fg, fg_color=bg)
 
@@ -1364,55 +1827,117 @@ class ViteControlCenter(ctk.CTk):
 
     # --------- Logging ----------
     def enqueue_log(self, level: str, message: str):
-        self.log_q.put(LogEvent(level=level, message=message, timestamp=now_ts()))
+        self.enqueue_logs(level, (message,))
+
+    def enqueue_logs(self, level: str, messages):
+        # A whole read() worth of lines shares one timestamp and one UI wake-up.
+        if not messages:
+            return
+        ts = now_ts()
+        events = [self._acquire_log(level, message, ts) for message in messages]
+        with self._log_lock:
+            # If the UI can't keep up, the deque discards the oldest lines.
+            overflow = len(self._log_buf) + len(events) - LOG_QUEUE_MAX
+            if overflow > 0:
+                self._dropped_logs += overflow
+            self._log_buf.extend(events)
+            # Edge-triggered: only the first batch after a drain wakes the UI.
+            notify = not self._log_notify_pending
+            self._log_notify_pending = True
+        if notify:
+            # event_generate isn't thread-safe, so marshal it onto the Tk thread.
+            self.after(0, self._post_log_ready)
+
+    def _acquire_log(self, level: str, message: str, timestamp: str) -> LogEvent:
+        # list.pop/append are atomic under the GIL, so producers on worker
+        # threads and the Tk thread releasing events can share the pool.
+        try:
+            ev = self._log_pool.pop()
+        except IndexError:
+            return LogEvent(level, message, timestamp)
+        ev.level = level
+        ev.message = message
+        ev.timestamp = timestamp
+        return ev
+
+    def _release_log(self, ev: LogEvent):
+        if len(self._log_pool) < LOG_POOL_MAX:
+            self._log_pool.append(ev)
+
+    def _post_log_ready(self):
+        self.event_generate("<<LogReady>>", when="tail")
 
     def clear_logs(self):
-        self.log_text.configure(state="normal")
         self.log_text.delete("1.0", "end")
-        self.log_text.configure(state="disabled")
         self.enqueue_log("info", "Logs cleared.")
 
-    def _drain_logs(self):
+    def _on_filter_changed(self, *_):
+        # "/pattern/" is a regex; anything else is a plain case-insensitive
+        # substring. Both compile to one pattern so draining just calls search().
         filt = self.log_filter_var.get().strip()
-        regex = None
-        if filt:
-            m = re.fullmatch(r"/(.+)/", filt)
-            if m:
-                try:
-                    regex = re.compile(m.group(1), re.IGNORECASE)
-                except re.error:
-                    regex = None
-
-        changed = False
-        while True:
+        if filt == self._filter_src:
+            return  # e.g. only surrounding whitespace changed
+        self._filter_src = filt
+        if not filt:
+            self._filter_re = None
+            return
+        m = re.fullmatch(r"/(.+)/", filt)
+        if m:
             try:
-                ev = self.log_q.get_nowait()
-            except queue.Empty:
-                break
-
-            if filt:
-                hay = f"{ev.timestamp} {ev.level.upper()} {ev.message}"
-                if regex:
-                    if not regex.search(hay):
-                        continue
-                else:
-                    if filt.lower() not in hay.lower():
-                        continue
-
-            self._append_log(ev)
-            changed = True
+                self._filter_re = re.compile(m.group(1), re.IGNORECASE)
+                return
+            except re.error:
+                pass
+        self._filter_re = re.compile(re.escape(filt), re.IGNORECASE)
+
+    def _drain_logs(self, _event=None):
+        # One lock round-trip takes everything queued since the last drain.
+        with self._log_lock:
+            self._log_notify_pending = False
+            batch = self._log_buf
+            self._log_buf = deque(maxlen=LOG_QUEUE_MAX)
+            dropped, self._dropped_logs = self._dropped_logs, 0
+
+        if dropped:
+            summary = f"[{dropped} log lines dropped]"
+            batch = [self._acquire_log("warning", summary, now_ts()), *batch]
+
+        shown = batch
+        search = self._filter_re.search if self._filter_re else None
+        if search:
+            shown = [
+                ev
+                for ev in batch
+                if search(f"{ev.timestamp} {ev.level.upper()} {ev.message}")
+            ]
+
+        if shown:
+            self._append_logs(shown)
+
+        for ev in batch:
+            self._release_log(ev)
+
+    def _append_logs(self, events):
+        # The whole batch goes to Tk as one multi-segment Text.insert
+        # (chars, tags, chars, tags, ...) and is scrolled into view once.
+        labels = LOG_LEVEL_LABELS
+        args: list[str] = []
+        for ev in events:
+            args += (
+                ev.timestamp + " ",
+                "ts",
+                labels[ev.level] + ev.message + "\n",
+                ev.level,
+            )
 
-        if changed:
-            self.log_text.see("end")
+        self.log_text.insert("end", *args)
 
-        self.after(60, self._drain_logs)
+        # Rolling window: one bulk delete keeps the Text B-tree bounded.
+        lines = int(self.log_text.index("end-1c").split(".")[0])
+        if lines > LOG_VIEW_MAX_LINES:
+            self.log_text.delete("1.0", f"{lines - LOG_VIEW_KEEP_LINES}.0")
 
-    def _append_log(self, ev: LogEvent):
-        self.log_text.configure(state="normal")
-        self.log_text.insert("end", f"{ev.timestamp} ", ("ts",))
-        self.log_text.insert("end", f"[{ev.level.upper():7}] ", (ev.level,))
-        self.log_text.insert("end", ev.message + "\n", (ev.level,))
-        self.log_text.configure(state="disabled")
+        self.log_text.see("end")
 
     # --------- Shutdown ----------
     def on_close(self):
@@ -1424,14 +1949,7 @@ class ViteControlCenter(ctk.CTk):
     # --------- Color helper ----------
     def _blend(self, a: str, b: str, t: float) -> str:
         t = max(0.0, min(1.0, t))
-        a = a.lstrip("#")
-        b = b.lstrip("#")
-        ar, ag, ab = int(a[0:2], 16), int(a[2:4], 16), int(a[4:6], 16)
-        br, bg, bb = int(b[0:2], 16), int(b[2:4], 16), int(b[4:6], 16)
-        cr = int(ar + (br - ar) * t)
-        cg = int(ag + (bg - ag) * t)
-        cb = int(ab + (bb - ab) * t)
-        return f"#{cr:02x}{cg:02x}{cb:02x}"
+        return _blend_rgb(_hex_rgb(a), _hex_rgb(b), int(t * 256))
 
 
 if __name__ == "__main__":